@@ -1,23 +1,33 @@
 """Analysis status and management endpoints."""
 
+import hashlib
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional, List
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
-from pydantic import BaseModel, Field
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query, Path
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 import structlog
 
-from ...core.database import get_database_session
-from ...models.orchestrator import OrchestrationResponse
-from ...services.orchestration_service import OrchestrationService
+from ...models.orchestrator import OrchestrationResponse, OrchestrationStatus
+from ...services.orchestration_service import (
+    OrchestrationService,
+    get_shared_orchestration_service,
+)
 
 logger = structlog.get_logger(__name__)
-router = APIRouter(prefix="/analysis", tags=["📊 Analysis Management"])
+router = APIRouter(
+    prefix="/analysis",
+    tags=["📊 Analysis Management"],
+    default_response_class=ORJSONResponse,
+)
 
 
 class AnalysisSummary(BaseModel):
     """Summary of an analysis request."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     request_id: str
     status: str
     project_id: int
@@ -31,6 +41,8 @@ class AnalysisSummary(BaseModel):
 
 class ActiveAnalysesResponse(BaseModel):
     """Response for active analyses list."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     active_analyses: int = Field(description="Number of currently active analyses")
     total_found: int = Field(description="Total analyses found")
     analyses: List[AnalysisSummary] = Field(description="List of analysis summaries")
@@ -45,17 +57,100 @@ class AnalysisStatsResponse(BaseModel):
     recent_activity: Dict[str, Any]
 
 
-async def get_orchestration_service(
-    db: AsyncSession = Depends(get_database_session)
-) -> OrchestrationService:
+async def get_orchestration_service() -> OrchestrationService:
     """Get orchestration service dependency."""
-    return OrchestrationService(db)
+    return get_shared_orchestration_service()
 
 
-@router.get("/{request_id}",
-            response_model=OrchestrationResponse,
-            summary="🔍 Get Analysis Status", 
-            description="""
+@dataclass(frozen=True)
+class ListFilters:
+    """Query filters for listing analyses."""
+    limit: int
+    offset: int
+    status: Optional[str]
+    project_id: Optional[int]
+
+
+async def get_list_filters(
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of analyses to return"),
+    offset: int = Query(0, ge=0, description="Number of matching analyses to skip"),
+    status: Optional[str] = Query(None, description="Filter by analysis status"),
+    project_id: Optional[int] = Query(None, description="Filter by GitLab project ID"),
+) -> ListFilters:
+    """Get list filters dependency.
+    
+    Declared as a coroutine rather than using the class as the dependency:
+    FastAPI runs plain callables such as class constructors in its
+    threadpool, while coroutines run directly on the event loop.
+    
+    Args:
+        limit: Maximum number of analyses to return
+        offset: Number of matching analyses to skip
+        status: Optional status filter
+        project_id: Optional GitLab project filter
+        
+    Returns:
+        Validated list filters
+    """
+    return ListFilters(limit=limit, offset=offset, status=status, project_id=project_id)
+
+
+# Analyses in these states are never modified again
+_TERMINAL_STATUSES = frozenset({
+    OrchestrationStatus.COMPLETED,
+    OrchestrationStatus.FAILED,
+    OrchestrationStatus.TIMEOUT,
+})
+
+
+def _analysis_etag(analysis: OrchestrationResponse) -> str:
+    """Build a weak ETag for the current state of an analysis.
+    
+    The tag is weak because the same validator covers both the gzip and
+    the identity encoding of the response.
+    
+    Args:
+        analysis: Analysis to fingerprint
+        
+    Returns:
+        Quoted ETag value
+    """
+    # updated_at is not bumped for every step, so the step count and
+    # completion time are part of the fingerprint too
+    fingerprint = (
+        f"{analysis.request_id}:{analysis.status.value}:{analysis.updated_at}:"
+        f"{analysis.completed_at}:{len(analysis.processing_steps)}"
+    )
+    return f'W/"{hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against the current ETag.
+    
+    Uses the weak comparison If-None-Match calls for: the header may list
+    several tags or be "*", and W/ prefixes are ignored on both sides, so
+    proxies that weaken tags still get a 304.
+    
+    Args:
+        if_none_match: If-None-Match header value, if any
+        etag: Current ETag of the resource
+        
+    Returns:
+        True if the client's cached representation is still current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque_tag
+        for tag in if_none_match.split(",")
+    )
+
+
+_GET_ANALYSIS_DESCRIPTION = """
 **Get the status and results of a specific analysis request.**
 
 Retrieves detailed information about an analysis:
@@ -70,50 +165,67 @@ Retrieves detailed information about an analysis:
 - `processing` - Currently being analyzed
 - `completed` - Analysis finished successfully
 - `failed` - Analysis encountered an error
-            """,
-            responses={
-                200: {
-                    "description": "Analysis found and details returned",
-                    "content": {
-                        "application/json": {
-                            "example": {
-                                "request_id": "webhook_1695128400000",
-                                "status": "completed",
-                                "project_id": 1001,
-                                "pipeline_id": 123456,
-                                "created_at": "2025-09-19T13:57:00.000Z",
-                                "ai_analysis": {
-                                    "summary": "Build failed due to missing Node.js dependencies",
-                                    "root_cause": "npm install failed - package.json missing dependencies",
-                                    "recommendations": ["Add missing dependencies to package.json"]
-                                }
-                            }
-                        }
-                    }
-                },
-                404: {
-                    "description": "Analysis not found",
-                    "content": {
-                        "application/json": {
-                            "example": {
-                                "detail": "Analysis with request_id 'invalid_id' not found"
-                            }
-                        }
+"""
+
+_GET_ANALYSIS_RESPONSES: Dict[int, Dict[str, Any]] = {
+    200: {
+        "model": OrchestrationResponse,
+        "description": "Analysis found and details returned",
+        "content": {
+            "application/json": {
+                "example": {
+                    "request_id": "webhook_1695128400000",
+                    "status": "completed",
+                    "project_id": 1001,
+                    "pipeline_id": 123456,
+                    "created_at": "2025-09-19T13:57:00.000Z",
+                    "ai_analysis": {
+                        "summary": "Build failed due to missing Node.js dependencies",
+                        "root_cause": "npm install failed - package.json missing dependencies",
+                        "recommendations": ["Add missing dependencies to package.json"]
                     }
                 }
-            })
+            }
+        }
+    },
+    304: {
+        "description": "Analysis unchanged since the ETag sent in If-None-Match"
+    },
+    404: {
+        "description": "Analysis not found",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Analysis with request_id 'invalid_id' not found"
+                }
+            }
+        }
+    }
+}
+
+
+@router.get("/{request_id}",
+            response_model=None,
+            summary="🔍 Get Analysis Status", 
+            description=_GET_ANALYSIS_DESCRIPTION,
+            responses=_GET_ANALYSIS_RESPONSES)
 async def get_analysis_status(
+    request: Request,
     request_id: str = Path(..., description="Analysis request ID"),
     orchestration_service: OrchestrationService = Depends(get_orchestration_service),
-) -> OrchestrationResponse:
+) -> Response:
     """Get analysis status by request ID.
     
+    Responses carry an ETag so polling clients can revalidate with
+    If-None-Match; finished analyses are also marked as immutable.
+    
     Args:
+        request: Incoming request
         request_id: Analysis request ID
         orchestration_service: Orchestration service dependency
         
     Returns:
-        Analysis status and results
+        Analysis status and results, or an empty 304 when unchanged
         
     Raises:
         HTTPException: When analysis not found
@@ -126,13 +238,23 @@ async def get_analysis_status(
             detail=f"Analysis with request_id '{request_id}' not found"
         )
     
-    return analysis
+    etag = _analysis_etag(analysis)
+    if analysis.status in _TERMINAL_STATUSES:
+        cache_control = "public, max-age=3600, immutable"
+    else:
+        cache_control = "no-cache"
+    
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    # The service already holds a validated model; dump it once instead of
+    # letting a response_model validate it a second time
+    return ORJSONResponse(analysis.model_dump(mode="json"), headers=headers)
 
 
-@router.get("/",
-            response_model=ActiveAnalysesResponse,
-            summary="📋 List Active Analyses",
-            description="""
+_LIST_ANALYSES_DESCRIPTION = """
 **List all currently active and recent analysis requests.**
 
 Provides overview of:
@@ -143,6 +265,7 @@ Provides overview of:
 
 **Filtering Options:**
 - Limit results with `limit` parameter
+- Page through results with `offset` parameter
 - Filter by status with `status` parameter
 - Filter by project with `project_id` parameter
 
@@ -150,75 +273,71 @@ Perfect for:
 - Monitoring analysis progress
 - Debugging processing issues
 - Performance analysis
-            """,
-            responses={
-                200: {
-                    "description": "List of analyses",
-                    "content": {
-                        "application/json": {
-                            "example": {
-                                "active_analyses": 2,
-                                "total_found": 5,
-                                "analyses": [
-                                    {
-                                        "request_id": "webhook_1695128400000",
-                                        "status": "processing",
-                                        "project_id": 1001,
-                                        "pipeline_id": 123456,
-                                        "created_at": "2025-09-19T13:57:00.000Z",
-                                        "ai_provider": "openai"
-                                    }
-                                ]
-                            }
+"""
+
+_LIST_ANALYSES_RESPONSES: Dict[int, Dict[str, Any]] = {
+    200: {
+        "model": ActiveAnalysesResponse,
+        "description": "List of analyses",
+        "content": {
+            "application/json": {
+                "example": {
+                    "active_analyses": 2,
+                    "total_found": 5,
+                    "analyses": [
+                        {
+                            "request_id": "webhook_1695128400000",
+                            "status": "processing",
+                            "project_id": 1001,
+                            "pipeline_id": 123456,
+                            "created_at": "2025-09-19T13:57:00.000Z",
+                            "ai_provider": "openai"
                         }
-                    }
+                    ]
                 }
-            })
+            }
+        }
+    }
+}
+
+
+@router.get("/",
+            response_model=None,
+            summary="📋 List Active Analyses",
+            description=_LIST_ANALYSES_DESCRIPTION,
+            responses=_LIST_ANALYSES_RESPONSES)
 async def list_active_analyses(
-    limit: int = Query(50, ge=1, le=100, description="Maximum number of analyses to return"),
-    status: Optional[str] = Query(None, description="Filter by analysis status"),
-    project_id: Optional[int] = Query(None, description="Filter by GitLab project ID"),
+    filters: ListFilters = Depends(get_list_filters),
     orchestration_service: OrchestrationService = Depends(get_orchestration_service),
-) -> ActiveAnalysesResponse:
+) -> Response:
     """List all active analyses.
     
     Args:
+        filters: Paging and filter query parameters
         orchestration_service: Orchestration service dependency
         
     Returns:
         List of active analyses
     """
-    active_analyses = await orchestration_service.list_active_analyses()
-    
-    # Convert to AnalysisSummary objects
-    summaries = []
-    for analysis in active_analyses:
-        try:
-            summary = AnalysisSummary(
-                request_id=analysis.request_id,
-                status=analysis.status.value,  # Convert enum to string
-                project_id=analysis.project_id,
-                pipeline_id=getattr(analysis, 'pipeline_id', None),
-                job_id=None,  # Not tracked currently
-                created_at=str(analysis.created_at),
-                processing_time_ms=analysis.total_processing_time_ms,
-                ai_provider=analysis.ai_analysis.provider if analysis.ai_analysis else None,
-                error_message=analysis.error_message
-            )
-            summaries.append(summary)
-        except Exception as e:
-            logger.error("Failed to convert analysis to summary", error=str(e))
-            continue
-    
-    return ActiveAnalysesResponse(
-        active_analyses=len(active_analyses),
-        total_found=len(summaries),
-        analyses=summaries
+    active_analyses = await orchestration_service.count_active_analyses()
+    total_found, rows = await orchestration_service.list_analyses_projection(
+        limit=filters.limit,
+        offset=filters.offset,
+        status=filters.status,
+        project_id=filters.project_id,
     )
+    
+    # Rows are projected by the service from its own state and already match
+    # AnalysisSummary, so they are serialized as-is without pydantic models
+    return ORJSONResponse({
+        "active_analyses": active_analyses,
+        "total_found": total_found,
+        "analyses": rows,
+    })
 
 
 @router.get("/stats/summary",
-            response_model=Dict[str, Any],
+            response_model=None,
             summary="Analysis Statistics",
             description="Get summary statistics about analysis performance.")
 async def get_analysis_stats() -> Dict[str, Any]:
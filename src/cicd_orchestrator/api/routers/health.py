@@ -1,22 +1,118 @@
 """Health check endpoints."""
 
-from datetime import datetime
+import asyncio
+import time
+from datetime import datetime, timezone
 from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, status, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict
+import orjson
 import structlog
 
-from ...services.orchestration_service import OrchestrationService
+from ...services.orchestration_service import (
+    OrchestrationService,
+    get_shared_orchestration_service,
+)
 from ...core.config import settings
 from ...core.database import check_database_health
 
 logger = structlog.get_logger(__name__)
-router = APIRouter(prefix="/health", tags=["🏥 Health Monitoring"])
+router = APIRouter(
+    prefix="/health",
+    tags=["🏥 Health Monitoring"],
+    default_response_class=ORJSONResponse,
+)
+
+# Component keys checked by the detailed and readiness probes
+_REQUIRED_COMPONENTS = ("orchestration_service", "ai_service", "gitlab_client", "database")
+_AI_PROVIDER_KEYS = ("ai_openai", "ai_anthropic", "ai_azure_openai")
+
+# Wall-clock second and its formatted UTC timestamp, shared by all probes
+_last_ts_s = 0
+_last_ts_str = ""
+
+
+def _now_iso() -> str:
+    """Get the current UTC time as an ISO-8601 string.
+    
+    Formatting happens at most once per wall-clock second; probes within
+    the same second reuse the cached string.
+    
+    Returns:
+        UTC timestamp such as ``2025-09-19T13:57:00Z``
+    """
+    global _last_ts_s, _last_ts_str
+    
+    now_s = int(time.time())
+    if now_s != _last_ts_s:
+        _last_ts_s = now_s
+        _last_ts_str = datetime.fromtimestamp(now_s, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return _last_ts_str
+
+
+# Basic health body, re-rendered lazily at most once per second
+_HEALTH_REFRESH_SECONDS = 1.0
+_health_bytes = b""
+_health_rendered_at = float("-inf")
+
+
+def _get_health_bytes() -> bytes:
+    """Get the serialized basic health body.
+    
+    The body is only rebuilt when a probe arrives more than
+    _HEALTH_REFRESH_SECONDS after the last render, so idle pods do no work.
+    
+    Returns:
+        JSON-encoded health status
+    """
+    global _health_bytes, _health_rendered_at
+    
+    now = time.monotonic()
+    if now - _health_rendered_at >= _HEALTH_REFRESH_SECONDS:
+        _health_bytes = orjson.dumps({
+            "status": "healthy",
+            "service": "cicd-orchestrator",
+            "timestamp": _now_iso(),
+            "version": settings.app_version,
+            "environment": settings.environment,
+        })
+        _health_rendered_at = now
+    return _health_bytes
+
+
+# Liveness body, refreshed on the same schedule as the basic health body
+_liveness_bytes = b""
+_liveness_rendered_at = float("-inf")
+
+
+def _get_liveness_bytes() -> bytes:
+    """Get the serialized liveness body.
+    
+    Like the basic health body, it is rebuilt at most once per
+    _HEALTH_REFRESH_SECONDS.
+    
+    Returns:
+        JSON-encoded liveness status
+    """
+    global _liveness_bytes, _liveness_rendered_at
+    
+    now = time.monotonic()
+    if now - _liveness_rendered_at >= _HEALTH_REFRESH_SECONDS:
+        _liveness_bytes = orjson.dumps({
+            "status": "alive",
+            "service": "cicd-orchestrator",
+            "timestamp": _now_iso(),
+        })
+        _liveness_rendered_at = now
+    return _liveness_bytes
 
 
 class HealthResponse(BaseModel):
     """Health check response model."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     status: str
     service: str
     timestamp: str
@@ -37,13 +133,10 @@ class ReadinessResponse(HealthResponse):
 
 async def get_orchestration_service() -> OrchestrationService:
     """Get orchestration service dependency."""
-    return OrchestrationService()
+    return get_shared_orchestration_service()
 
 
-@router.get("/", 
-            response_model=HealthResponse,
-            summary="💚 Basic Health Check",
-            description="""
+_HEALTH_DESCRIPTION = """
 **Quick health check endpoint for load balancers and monitoring.**
 
 Returns basic service status information:
@@ -56,40 +149,41 @@ Perfect for:
 - Load balancer health checks
 - Basic monitoring
 - Quick status verification
-            """,
-            responses={
-                200: {
-                    "description": "Service is healthy",
-                    "content": {
-                        "application/json": {
-                            "example": {
-                                "status": "healthy",
-                                "service": "cicd-orchestrator",
-                                "timestamp": "2025-09-19T13:57:00.000Z",
-                                "version": "0.1.0",
-                                "environment": "development"
-                            }
-                        }
-                    }
+"""
+
+_HEALTH_RESPONSES: Dict[int, Dict[str, Any]] = {
+    200: {
+        "description": "Service is healthy",
+        "content": {
+            "application/json": {
+                "example": {
+                    "status": "healthy",
+                    "service": "cicd-orchestrator",
+                    "timestamp": "2025-09-19T13:57:00.000Z",
+                    "version": "0.1.0",
+                    "environment": "development"
                 }
-            })
-async def health_check() -> HealthResponse:
+            }
+        }
+    }
+}
+
+
+@router.get("/", 
+            response_model=HealthResponse,
+            summary="💚 Basic Health Check",
+            description=_HEALTH_DESCRIPTION,
+            responses=_HEALTH_RESPONSES)
+async def health_check() -> Response:
     """Basic health check endpoint.
     
     Returns:
         Health status information
     """
-    return HealthResponse(
-        status="healthy",
-        service="cicd-orchestrator",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-    )
+    return Response(content=_get_health_bytes(), media_type="application/json")
 
 
-@router.get("/detailed",
-            response_model=DetailedHealthResponse, 
-            summary="🔍 Detailed Health Check",
-            description="""
+_DETAILED_HEALTH_DESCRIPTION = """
 **Comprehensive health check including all service dependencies.**
 
 Provides detailed status of:
@@ -103,32 +197,40 @@ Provides detailed status of:
 - `healthy` - All components working
 - `degraded` - Some components down but service functional
 - `unhealthy` - Critical components down
-            """,
-            responses={
-                200: {
-                    "description": "Detailed health information",
-                    "content": {
-                        "application/json": {
-                            "example": {
-                                "status": "healthy",
-                                "service": "cicd-orchestrator",
-                                "timestamp": "2025-09-19T13:57:00.000Z",
-                                "version": "0.1.0",
-                                "environment": "development",
-                                "components": {
-                                    "ai_openai": True,
-                                    "ai_anthropic": True,
-                                    "gitlab_client": True
-                                },
-                                "details": {
-                                    "active_analyses": 0,
-                                    "available_ai_providers": 2
-                                }
-                            }
-                        }
+"""
+
+_DETAILED_HEALTH_RESPONSES: Dict[int, Dict[str, Any]] = {
+    200: {
+        "description": "Detailed health information",
+        "content": {
+            "application/json": {
+                "example": {
+                    "status": "healthy",
+                    "service": "cicd-orchestrator",
+                    "timestamp": "2025-09-19T13:57:00.000Z",
+                    "version": "0.1.0",
+                    "environment": "development",
+                    "components": {
+                        "ai_openai": True,
+                        "ai_anthropic": True,
+                        "gitlab_client": True
+                    },
+                    "details": {
+                        "active_analyses": 0,
+                        "available_ai_providers": 2
                     }
                 }
-            })
+            }
+        }
+    }
+}
+
+
+@router.get("/detailed",
+            response_model=DetailedHealthResponse, 
+            summary="🔍 Detailed Health Check",
+            description=_DETAILED_HEALTH_DESCRIPTION,
+            responses=_DETAILED_HEALTH_RESPONSES)
 async def detailed_health_check(
     orchestration_service: OrchestrationService = Depends(get_orchestration_service),
 ) -> DetailedHealthResponse:
@@ -141,24 +243,39 @@ async def detailed_health_check(
         Detailed health status of all components
     """
     try:
-        # Get health status from orchestration service
-        health_status = await orchestration_service.health_check()
+        # Service, database and analysis checks are independent - run them concurrently
+        health_status, db_health, active_analyses = await asyncio.gather(
+            orchestration_service.health_check(),
+            check_database_health(),
+            orchestration_service.count_active_analyses(),
+            return_exceptions=True,
+        )
         
-        # Check database health
-        db_health = await check_database_health()
+        # Orchestration service status is critical - report unhealthy without it
+        if isinstance(health_status, Exception):
+            raise health_status
+        
+        # A failed database or analysis check only degrades the service
+        if isinstance(db_health, Exception):
+            logger.warning("Database health check failed", error=str(db_health))
+            db_health = {"status": "error", "error": str(db_health)}
         health_status["database"] = db_health["status"] == "healthy"
         
+        if isinstance(active_analyses, Exception):
+            logger.warning("Active analyses count failed", error=str(active_analyses))
+            active_analyses = None
+        
         # Determine overall health
-        all_healthy = all(health_status.values())
+        all_healthy = all(health_status.get(key, False) for key in _REQUIRED_COMPONENTS)
         overall_status = "healthy" if all_healthy else "degraded"
         
         return {
             "status": overall_status,
             "service": "cicd-orchestrator",
-            "timestamp": datetime.now().isoformat() + "Z",
+            "timestamp": _now_iso(),
             "components": health_status,
             "details": {
-                "active_analyses": len(await orchestration_service.list_active_analyses()),
+                "active_analyses": active_analyses,
                 "available_ai_providers": len(orchestration_service.ai_service.get_available_providers()),
                 "database": db_health
             }
@@ -169,14 +286,15 @@ async def detailed_health_check(
         return {
             "status": "unhealthy", 
             "service": "cicd-orchestrator",
-            "timestamp": datetime.now().isoformat() + "Z",
+            "timestamp": _now_iso(),
             "components": {},
             "details": {"error": str(e)}
         }
 
 
 @router.get("/readiness",
-            response_model=Dict[str, Any],
+            response_model=None,
+            include_in_schema=False,
             summary="Readiness Check", 
             description="Kubernetes readiness probe endpoint.")
 async def readiness_check(
@@ -195,10 +313,7 @@ async def readiness_check(
         health_status = await orchestration_service.health_check()
         
         # Service is ready if orchestration service and at least one AI provider is healthy
-        ai_providers_healthy = any([
-            health_status.get(f"ai_{provider}", False) 
-            for provider in ["openai", "anthropic", "azure_openai"]
-        ])
+        ai_providers_healthy = any(health_status.get(key, False) for key in _AI_PROVIDER_KEYS)
         
         gitlab_healthy = health_status.get("gitlab_client", False)
         
@@ -207,7 +322,7 @@ async def readiness_check(
         return {
             "status": "ready" if is_ready else "not_ready",
             "service": "cicd-orchestrator",
-            "timestamp": "2024-01-01T00:00:00Z",
+            "timestamp": _now_iso(),
             "checks": {
                 "ai_providers": ai_providers_healthy,
                 "gitlab_client": gitlab_healthy,
@@ -219,24 +334,21 @@ async def readiness_check(
         return {
             "status": "not_ready",
             "service": "cicd-orchestrator", 
-            "timestamp": "2024-01-01T00:00:00Z",
+            "timestamp": _now_iso(),
             "error": str(e),
         }
 
 
 @router.get("/liveness",
-            response_model=Dict[str, Any],
+            response_model=None,
+            include_in_schema=False,
             summary="Liveness Check",
             description="Kubernetes liveness probe endpoint.")
-async def liveness_check() -> Dict[str, Any]:
+async def liveness_check() -> Response:
     """Liveness check for Kubernetes.
     
     Returns:
         Liveness status
     """
     # Simple liveness check - just verify the application is running
-    return {
-        "status": "alive",
-        "service": "cicd-orchestrator",
-        "timestamp": "2024-01-01T00:00:00Z",
-    }
+    return Response(content=_get_liveness_bytes(), media_type="application/json")
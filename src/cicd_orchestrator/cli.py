@@ -1,17 +1,17 @@
 """CLI commands for CI/CD Orchestrator."""
 
 import asyncio
+import atexit
 import sys
 from typing import Optional
 
-import structlog
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from .core.config import settings
-from .core.database import init_database, close_database, db_manager
-from .core.database_setup import create_all_tables, drop_all_tables, recreate_all_tables
+
+# Database, service and table-rendering modules are imported inside the
+# commands that use them, so `version` and `--help` start quickly
 
 app = typer.Typer(
     name="cicd-orchestrator",
@@ -20,7 +20,30 @@ app = typer.Typer(
 )
 
 console = Console()
-logger = structlog.get_logger(__name__)
+
+# Event loop shared by every command run in this process
+_runner: Optional[asyncio.Runner] = None
+
+
+def _run(coro):
+    """Run a coroutine on the CLI's shared event loop.
+    
+    The loop is created on first use and closed at interpreter exit, so
+    commands invoked in the same process reuse it instead of building a
+    new loop and executor each time.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    global _runner
+    
+    if _runner is None:
+        _runner = asyncio.Runner()
+        atexit.register(_runner.close)
+    return _runner.run(coro)
 
 
 @app.command()
@@ -36,15 +59,24 @@ def serve(
     reload: bool = typer.Option(settings.reload, "--reload", "-r", help="Enable auto-reload"),
 ):
     """Start the web server."""
+    from importlib.util import find_spec
+    
     import uvicorn
     
-    console.print(f"🚀 Starting CI/CD Orchestrator on {host}:{port}")
+    # uvicorn[standard] provides the C event loop and HTTP parser on
+    # supported platforms; fall back to the pure-Python stack elsewhere
+    loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
+    
+    console.print(f"🚀 Starting CI/CD Orchestrator on {host}:{port} (loop={loop}, http={http})")
     
     uvicorn.run(
         "cicd_orchestrator.main:app",
         host=host,
         port=port,
         reload=reload,
+        loop=loop,
+        http=http,
         log_level=settings.log_level.lower(),
     )
 
@@ -52,6 +84,8 @@ def serve(
 @app.command()
 def config():
     """Show current configuration."""
+    from rich.table import Table
+    
     table = Table(title="CI/CD Orchestrator Configuration")
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="green")
@@ -83,33 +117,39 @@ def config():
 def health():
     """Check service health."""
     async def check_health():
-        from .core.database import get_database_session
-        from .services.orchestration_service import OrchestrationService
+        from rich.table import Table
+        
+        from .services.orchestration_service import get_shared_orchestration_service
+        
+        # Same shared instance the API uses; its health check needs no DB session
+        orchestration_service = get_shared_orchestration_service()
         
         try:
-            async with get_database_session() as db:
-                orchestration_service = OrchestrationService(db)
-                health_status = await orchestration_service.health_check()
-                
-                table = Table(title="Health Check")
-                table.add_column("Component", style="cyan")
-                table.add_column("Status", style="green")
-                
-                for component, is_healthy in health_status.items():
-                    status_text = "✅ Healthy" if is_healthy else "❌ Unhealthy"
-                    table.add_row(component, status_text)
-                
-                console.print(table)
+            health_status = await orchestration_service.health_check()
+            
+            table = Table(title="Health Check")
+            table.add_column("Component", style="cyan")
+            table.add_column("Status", style="green")
+            
+            for component, is_healthy in health_status.items():
+                status_text = "✅ Healthy" if is_healthy else "❌ Unhealthy"
+                table.add_row(component, status_text)
+            
+            console.print(table)
         except Exception as e:
             console.print(f"❌ Health check failed: {e}")
             sys.exit(1)
+        finally:
+            await orchestration_service.close()
     
-    asyncio.run(check_health())
+    _run(check_health())
 
 
 @app.command()
 def db_create():
     """Create all database tables."""
+    from .core.database import init_database, close_database
+    
     async def _create():
         try:
             await init_database()
@@ -120,7 +160,7 @@ def db_create():
         finally:
             await close_database()
     
-    asyncio.run(_create())
+    _run(_create())
 
 
 @app.command()
@@ -130,6 +170,9 @@ def db_drop():
         console.print("Operation cancelled")
         return
     
+    from .core.database import close_database, db_manager
+    from .core.database_setup import drop_all_tables
+    
     async def _drop():
         try:
             success = await db_manager.initialize()
@@ -145,7 +188,7 @@ def db_drop():
         finally:
             await close_database()
     
-    asyncio.run(_drop())
+    _run(_drop())
 
 
 @app.command()
@@ -155,6 +198,9 @@ def db_recreate():
         console.print("Operation cancelled")
         return
     
+    from .core.database import close_database, db_manager
+    from .core.database_setup import recreate_all_tables
+    
     async def _recreate():
         try:
             success = await db_manager.initialize()
@@ -170,35 +216,28 @@ def db_recreate():
         finally:
             await close_database()
     
-    asyncio.run(_recreate())
+    _run(_recreate())
 
 
 @app.command()
 def db_status():
     """Check database connection and table status."""
+    from rich.table import Table
+    
+    from .core.database import close_database, db_manager
+    
     async def _status():
         try:
             success = await db_manager.initialize()
             if success:
-                from sqlalchemy import text
+                from sqlalchemy import inspect
                 
-                async with db_manager.engine.begin() as conn:
-                    # Check which tables exist - Oracle version
-                    if "oracle" in db_manager._get_db_type():
-                        result = await conn.execute(text("""
-                            SELECT table_name 
-                            FROM user_tables 
-                            ORDER BY table_name
-                        """))
-                    else:
-                        # PostgreSQL/SQLite fallback
-                        result = await conn.execute(text("""
-                            SELECT table_name 
-                            FROM information_schema.tables 
-                            WHERE table_schema = 'public'
-                            ORDER BY table_name
-                        """))
-                    tables = [row[0] for row in result.fetchall()]
+                async with db_manager.engine.connect() as conn:
+                    # Dialect reflection covers Oracle user_tables, PostgreSQL's
+                    # default schema and SQLite with one cached query each
+                    tables = sorted(await conn.run_sync(
+                        lambda sync_conn: inspect(sync_conn).get_table_names()
+                    ))
                 
                 table = Table(title="Database Status")
                 table.add_column("Property", style="cyan")
@@ -222,7 +261,7 @@ def db_status():
         finally:
             await close_database()
     
-    asyncio.run(_status())
+    _run(_status())
 
 
 @app.command()
@@ -253,7 +292,7 @@ def test_email():
             console.print(f"❌ Email test failed: {e}")
             sys.exit(1)
     
-    asyncio.run(_test())
+    _run(_test())
 
 
 def main():
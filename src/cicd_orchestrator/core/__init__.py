@@ -1,7 +1,16 @@
 """Core configuration and settings."""
 
+from typing import Any
+
 from .config import settings
 from .exceptions import ConfigurationError, OrchestrationError
-from .logging import setup_logging
 
 __all__ = ["settings", "ConfigurationError", "OrchestrationError", "setup_logging"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import setup_logging (and structlog with it) only when requested."""
+    if name == "setup_logging":
+        from .logging import setup_logging
+        return setup_logging
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 """Database configuration and connection management."""
 
 import asyncio
+import logging
 from typing import Optional
 from contextlib import asynccontextmanager
 
@@ -12,6 +13,8 @@ from sqlalchemy import text
 from .config import settings
 
 logger = structlog.get_logger(__name__)
+# Standard-library logger behind `logger`; its level check is cached by logging
+_std_logger = logging.getLogger(__name__)
 
 
 class Base(DeclarativeBase):
@@ -19,6 +22,11 @@ class Base(DeclarativeBase):
     pass
 
 
+# Connectivity probes, built once and reused for every ping
+_ORACLE_PING = text("SELECT 1 FROM DUAL")
+_GENERIC_PING = text("SELECT 1")
+
+
 class DatabaseManager:
     """Database connection manager."""
     
@@ -26,17 +34,31 @@ class DatabaseManager:
         self.engine: Optional[object] = None
         self.session_maker: Optional[async_sessionmaker] = None
         self._is_connected = False
+        # The URL does not change at runtime, so derived values are computed once
+        self._db_type = self._detect_db_type(settings.database_url)
+        self._masked_url = self._build_masked_url(settings.database_url)
     
     async def initialize(self) -> bool:
         """Initialize database connection."""
         try:
             # Create async engine
-            self.engine = create_async_engine(
-                settings.database_url,
-                echo=settings.database_echo,
-                pool_pre_ping=True,
-                pool_recycle=3600,
-            )
+            engine_kwargs = {
+                "echo": settings.database_echo,
+                "pool_pre_ping": True,
+                "pool_recycle": settings.database_pool_recycle,
+            }
+            
+            # SQLite uses a single-connection pool that takes no sizing options
+            if self._get_db_type() != "sqlite":
+                engine_kwargs["pool_size"] = settings.database_pool_size
+                engine_kwargs["max_overflow"] = settings.database_max_overflow
+                engine_kwargs["pool_timeout"] = settings.database_pool_timeout
+            
+            # asyncpg: disable PostgreSQL JIT, which slows down short queries
+            if "+asyncpg" in settings.database_url:
+                engine_kwargs["connect_args"] = {"server_settings": {"jit": "off"}}
+            
+            self.engine = create_async_engine(settings.database_url, **engine_kwargs)
             
             # Create session maker
             self.session_maker = async_sessionmaker(
@@ -72,33 +94,46 @@ class DatabaseManager:
             raise RuntimeError("Database engine not initialized")
             
         async with self.engine.begin() as conn:
-            # Test query - Oracle specific
-            if "oracle" in settings.database_url.lower():
-                result = await conn.execute(text("SELECT 1 FROM DUAL"))
-            else:
-                # PostgreSQL/SQLite fallback
-                result = await conn.execute(text("SELECT 1"))
+            result = await conn.execute(self.ping_statement)
             # fetchone() is not awaitable in SQLAlchemy 2.0
             row = result.fetchone()
-            
-        logger.debug("Database connection test successful")
+        
+        # Skip the structlog processor chain unless DEBUG is actually enabled
+        if _std_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Database connection test successful")
     
-    def _get_db_type(self) -> str:
-        """Get database type from URL."""
-        if "postgresql" in settings.database_url:
+    @staticmethod
+    def _detect_db_type(database_url: str) -> str:
+        """Detect database type from URL."""
+        if "postgresql" in database_url:
             return "postgresql"
-        elif "oracle" in settings.database_url:
+        elif "oracle" in database_url:
             return "oracle"
-        elif "sqlite" in settings.database_url:
+        elif "sqlite" in database_url:
             return "sqlite"
         else:
             return "unknown"
     
+    @staticmethod
+    def _build_masked_url(database_url: str) -> str:
+        """Mask sensitive info in database URL."""
+        if '@' in database_url:
+            return database_url.split('@')[0] + '@***'
+        return database_url
+    
+    def _get_db_type(self) -> str:
+        """Get database type from URL."""
+        return self._db_type
+    
     def _mask_db_url(self) -> str:
         """Mask sensitive info in database URL."""
-        if '@' in settings.database_url:
-            return settings.database_url.split('@')[0] + '@***'
-        return settings.database_url
+        return self._masked_url
+    
+    @property
+    def ping_statement(self):
+        """Connectivity probe for the configured database."""
+        # Oracle requires a FROM clause; PostgreSQL/SQLite accept a bare SELECT
+        return _ORACLE_PING if self._db_type == "oracle" else _GENERIC_PING
     
     @asynccontextmanager
     async def get_session(self):
@@ -187,12 +222,7 @@ async def check_database_health() -> dict:
     
     try:
         async with db_manager.get_session() as session:
-            # Oracle specific health check query
-            if "oracle" in settings.database_url.lower():
-                await session.execute(text("SELECT 1 FROM DUAL"))
-            else:
-                # PostgreSQL/SQLite fallback
-                await session.execute(text("SELECT 1"))
+            await session.execute(db_manager.ping_statement)
             
         return {
             "status": "healthy",
@@ -19,15 +19,20 @@ async def create_all_tables(engine: AsyncEngine) -> None:
         engine: AsyncEngine instance for database operations
     """
     async with engine.begin() as conn:
-        try:
-            # Create processed_emails table
-            await create_processed_emails_table(conn)
-            
-            logger.info("All database tables created successfully")
-            
-        except Exception as e:
-            logger.error("Failed to create database tables", error=str(e))
-            raise
+        await _create_tables(conn)
+
+
+async def _create_tables(conn) -> None:
+    """Create all application tables on an open connection."""
+    try:
+        # Create processed_emails table
+        await create_processed_emails_table(conn)
+        
+        logger.info("All database tables created successfully")
+        
+    except Exception as e:
+        logger.error("Failed to create database tables", error=str(e))
+        raise
 
 
 async def create_processed_emails_table(conn) -> None:
@@ -114,15 +119,20 @@ async def drop_all_tables(engine: AsyncEngine) -> None:
         engine: AsyncEngine instance for database operations
     """
     async with engine.begin() as conn:
-        try:
-            # Drop tables in reverse dependency order
-            await conn.execute(text("DROP TABLE processed_emails CASCADE CONSTRAINTS"))
-            
-            logger.warning("All database tables dropped")
-            
-        except Exception as e:
-            logger.error("Failed to drop database tables", error=str(e))
-            raise
+        await _drop_tables(conn)
+
+
+async def _drop_tables(conn) -> None:
+    """Drop all application tables on an open connection."""
+    try:
+        # Drop tables in reverse dependency order
+        await conn.execute(text("DROP TABLE processed_emails CASCADE CONSTRAINTS"))
+        
+        logger.warning("All database tables dropped")
+        
+    except Exception as e:
+        logger.error("Failed to drop database tables", error=str(e))
+        raise
 
 
 async def recreate_all_tables(engine: AsyncEngine) -> None:
@@ -136,8 +146,10 @@ async def recreate_all_tables(engine: AsyncEngine) -> None:
     """
     logger.warning("Recreating all database tables - ALL DATA WILL BE LOST!")
     
-    await drop_all_tables(engine)
-    await create_all_tables(engine)
+    # Drop and create on one checked-out connection instead of two
+    async with engine.begin() as conn:
+        await _drop_tables(conn)
+        await _create_tables(conn)
     
     logger.info("Database tables recreated successfully")
 
@@ -148,8 +160,8 @@ async def create_example_new_table(conn) -> None:
     
     When you need to add a new table:
     1. Create a function like this
-    2. Add the call to create_all_tables()
-    3. Add drop statement to drop_all_tables()
+    2. Add the call to _create_tables()
+    3. Add drop statement to _drop_tables()
     """
     
     create_table_sql = """
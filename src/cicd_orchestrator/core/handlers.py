@@ -1,7 +1,7 @@
 """Exception handlers for the FastAPI application."""
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import structlog
 
 from .exceptions import OrchestrationError
@@ -13,7 +13,7 @@ def configure_exception_handlers(app: FastAPI) -> None:
     """Configure exception handlers for the application."""
     
     @app.exception_handler(OrchestrationError)
-    async def orchestration_exception_handler(request: Request, exc: OrchestrationError) -> JSONResponse:
+    async def orchestration_exception_handler(request: Request, exc: OrchestrationError) -> ORJSONResponse:
         """Handle orchestration exceptions."""
         logger.error(
             "Orchestration error",
@@ -23,8 +23,9 @@ def configure_exception_handlers(app: FastAPI) -> None:
             method=request.method,
         )
         
-        return JSONResponse(
-            status_code=exc.status_code,
+        return ORJSONResponse(
+            # Only GitLab API errors carry an HTTP status of their own
+            status_code=getattr(exc, "status_code", None) or status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": exc.error_code or "orchestration_error",
                 "message": str(exc),
@@ -33,7 +34,7 @@ def configure_exception_handlers(app: FastAPI) -> None:
         )
 
     @app.exception_handler(Exception)
-    async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
         """Handle general exceptions."""
         logger.error(
             "Unhandled exception",
@@ -43,7 +44,7 @@ def configure_exception_handlers(app: FastAPI) -> None:
             exc_info=True,
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "Internal Server Error",
@@ -52,7 +53,7 @@ def configure_exception_handlers(app: FastAPI) -> None:
         )
 
     @app.exception_handler(404)
-    async def not_found_handler(request: Request, exc) -> JSONResponse:
+    async def not_found_handler(request: Request, exc) -> ORJSONResponse:
         """Handle 404 errors."""
         logger.warning(
             "Resource not found",
@@ -60,7 +61,7 @@ def configure_exception_handlers(app: FastAPI) -> None:
             method=request.method,
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={
                 "error": "Not Found",
@@ -69,7 +70,7 @@ def configure_exception_handlers(app: FastAPI) -> None:
         )
 
     @app.exception_handler(405)
-    async def method_not_allowed_handler(request: Request, exc) -> JSONResponse:
+    async def method_not_allowed_handler(request: Request, exc) -> ORJSONResponse:
         """Handle 405 errors."""
         logger.warning(
             "Method not allowed",
@@ -77,7 +78,7 @@ def configure_exception_handlers(app: FastAPI) -> None:
             method=request.method,
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=405,
             content={
                 "error": "Method Not Allowed",
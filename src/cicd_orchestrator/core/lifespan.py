@@ -8,7 +8,10 @@ import structlog
 
 from .config import settings
 from .database import init_database, close_database, get_database_session
-from ..services.orchestration_service import OrchestrationService
+from ..services.orchestration_service import (
+    OrchestrationService,
+    get_shared_orchestration_service,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -37,7 +40,7 @@ async def lifespan(app: FastAPI):
         logger.warning("Application starting without database connection")
         
     # Initialize orchestration service as the main brain
-    orchestration_service = OrchestrationService()
+    orchestration_service = get_shared_orchestration_service()
     
     # Start email monitoring if configured - orchestrator controls this
     if settings.trigger_mode in ["email", "both"] and settings.imap_enabled:
@@ -69,10 +72,14 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("🛑 Shutting down CI/CD Orchestrator")
     
-    # Stop orchestrator email monitoring if running
     if orchestration_service:
+        # Let webhook-triggered analyses finish before their clients are closed
+        await orchestration_service.drain(settings.analysis_drain_timeout)
+        
+        # Stop orchestrator email monitoring if running
         await orchestration_service.stop_email_monitoring()
         logger.info("Orchestrator email monitoring stopped")
+        await orchestration_service.close()
     
     # Close database connections
     await close_database()
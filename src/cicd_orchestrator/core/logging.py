@@ -1,15 +1,21 @@
 """Logging configuration for the CI/CD Orchestrator."""
 
+import atexit
 import logging
 import logging.config
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import structlog
 
 from .config import settings
 
+# Background listener that owns the real log handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(
     log_level: Optional[str] = None,
@@ -27,7 +33,8 @@ def setup_logging(
     log_format = log_format or settings.log_format
     log_file = log_file or settings.log_file
     
-    # Configure structlog
+    # Configure structlog; these steps run on the calling thread because they
+    # need the caller's context, level, clock and stack
     shared_processors = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.filter_by_level,
@@ -36,31 +43,29 @@ def setup_logging(
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
+        _capture_exc_info,
     ]
     
     if log_format == "json":
         # JSON format for production
-        processors = shared_processors + [
-            structlog.processors.dict_tracebacks,
-            structlog.processors.JSONRenderer(),
-        ]
-        formatter = structlog.stdlib.ProcessorFormatter(
-            processor=structlog.processors.JSONRenderer(),
-        )
+        renderer = structlog.processors.JSONRenderer()
     else:
         # Console format for development
-        processors = shared_processors + [
-            structlog.processors.dict_tracebacks,
-            structlog.dev.ConsoleRenderer(colors=True),
-        ]
-        formatter = structlog.stdlib.ProcessorFormatter(
-            processor=structlog.dev.ConsoleRenderer(colors=True),
-        )
+        renderer = structlog.dev.ConsoleRenderer(colors=True)
+    
+    # Traceback formatting and rendering happen in the formatter, which runs
+    # on the queue listener thread rather than the event loop
+    formatter_processors = [
+        structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+        structlog.processors.format_exc_info,
+        renderer,
+    ]
     
     # Configure structlog
     structlog.configure(
-        processors=processors,
+        processors=shared_processors + [
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
         wrapper_class=structlog.stdlib.BoundLogger,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -77,7 +82,7 @@ def setup_logging(
         "formatters": {
             "structured": {
                 "()": structlog.stdlib.ProcessorFormatter,
-                "processor": processors[-1],
+                "processors": formatter_processors,
             },
         },
         "handlers": {
@@ -135,6 +140,7 @@ def setup_logging(
         }
     
     logging.config.dictConfig(logging_config)
+    _enable_queue_logging(list(logging_config["loggers"]))
     
     # Log setup completion
     logger = structlog.get_logger(__name__)
@@ -143,6 +149,86 @@ def setup_logging(
         logger.info(f"Log file: {log_file}")
 
 
+def _capture_exc_info(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve ``exc_info=True`` to the active exception.
+    
+    The traceback is formatted later on the listener thread, where
+    sys.exc_info() no longer refers to the caller's exception, so only
+    the exception tuple is captured here.
+    
+    Args:
+        logger: Wrapped logger
+        method_name: Name of the log method called
+        event_dict: Event being logged
+        
+    Returns:
+        The event with exc_info resolved
+    """
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+class _PassThroughQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener's handlers."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Enqueue the record as-is.
+        
+        The queue never leaves the process, so the record does not need
+        to be pre-formatted; keeping exc_info lets the real formatter
+        render tracebacks itself.
+        
+        Args:
+            record: Log record to enqueue
+            
+        Returns:
+            The unchanged record
+        """
+        return record
+
+
+def _enable_queue_logging(logger_names: List[str]) -> None:
+    """Move handler I/O off the calling thread.
+    
+    The configured loggers get a single QueueHandler that only enqueues
+    records; a QueueListener thread writes them through the real handlers,
+    so a slow stdout or log file no longer blocks the event loop.
+    
+    Args:
+        logger_names: Names of the loggers configured by setup_logging
+    """
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    
+    # All configured loggers share the root handlers
+    handlers = logging.getLogger().handlers[:]
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _PassThroughQueueHandler(log_queue)
+    
+    for name in logger_names:
+        logging.getLogger(name).handlers = [queue_handler]
+    
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+
+def _stop_queue_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_logging)
+
+
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Get a structured logger instance.
     
@@ -6,6 +6,7 @@ from typing import List
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import structlog
 
 from .config import settings
@@ -15,10 +16,7 @@ logger = structlog.get_logger(__name__)
 
 def configure_cors(app: FastAPI) -> None:
     """Configure CORS middleware."""
-    if settings.cors_origins != "*":
-        origins = [origin.strip() for origin in settings.cors_origins.split(",")]
-    else:
-        origins = ["*"]
+    origins = list(settings.cors_origins)
 
     app.add_middleware(
         CORSMiddleware,
@@ -31,6 +29,13 @@ def configure_cors(app: FastAPI) -> None:
     logger.info("CORS middleware configured", allowed_origins=origins[:3] if len(origins) > 3 else origins)
 
 
+def configure_compression(app: FastAPI) -> None:
+    """Configure gzip compression for large response bodies."""
+    app.add_middleware(GZipMiddleware, minimum_size=512)
+    
+    logger.info("GZip middleware configured", minimum_size=512)
+
+
 def add_custom_middleware(app: FastAPI) -> None:
     """Add custom middleware to the application."""
     
@@ -83,3 +88,5 @@ def configure_middleware(app: FastAPI) -> None:
     """Configure all middleware for the application."""
     configure_cors(app)
     add_custom_middleware(app)
+    # Added last so it wraps the other middleware and compresses final bodies
+    configure_compression(app)
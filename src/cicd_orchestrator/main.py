@@ -1,8 +1,8 @@
 """Main FastAPI application entry point."""
 
-from typing import Any, Dict
-
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
+import orjson
 import structlog
 
 from .core.config import settings
@@ -23,6 +23,7 @@ app = FastAPI(
     description="🤖 Intelligent CI/CD pipeline failure analysis using AI",
     version=settings.app_version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.environment == "development" or settings.debug else None,
     redoc_url="/redoc" if settings.environment == "development" or settings.debug else None,
     contact={
@@ -41,36 +42,40 @@ configure_exception_handlers(app)
 configure_routes(app)
 
 
-@app.get("/", response_model=Dict[str, Any])
-async def root() -> Dict[str, Any]:
-    """🏠 Root endpoint with service information."""
-    return {
-        "service": "CI/CD Orchestrator",
-        "description": "🤖 Intelligent CI/CD pipeline failure analysis using AI",
-        "version": settings.app_version,
-        "environment": settings.environment,
-        "status": "running",
-        "endpoints": {
-            "health": "/health",
-            "detailed_health": "/health/detailed",
-            "webhooks": "/webhooks/gitlab",
-            "analysis": "/analysis",
-            "docs": "/docs" if settings.debug else "disabled",
-            "test": "/test" if settings.environment == "development" else "disabled"
-        },
-        "features": {
-            "gitlab_integration": True,
-            "ai_analysis": True,
-            "webhook_processing": True,
-            "test_scenarios": settings.environment == "development",
-            "database_connection": True
-        },
-        "quick_start": {
-            "health_check": "GET /health/",
-            "webhook_test": "POST /test/scenarios/failed_build" if settings.environment == "development" else "disabled",
-            "documentation": "/docs" if settings.debug else "disabled"
-        }
+# Service information only depends on settings, so it is serialized once
+_ROOT_BYTES = orjson.dumps({
+    "service": "CI/CD Orchestrator",
+    "description": "🤖 Intelligent CI/CD pipeline failure analysis using AI",
+    "version": settings.app_version,
+    "environment": settings.environment,
+    "status": "running",
+    "endpoints": {
+        "health": "/health",
+        "detailed_health": "/health/detailed",
+        "webhooks": "/webhooks/gitlab",
+        "analysis": "/analysis",
+        "docs": "/docs" if settings.debug else "disabled",
+        "test": "/test" if settings.environment == "development" else "disabled"
+    },
+    "features": {
+        "gitlab_integration": True,
+        "ai_analysis": True,
+        "webhook_processing": True,
+        "test_scenarios": settings.environment == "development",
+        "database_connection": True
+    },
+    "quick_start": {
+        "health_check": "GET /health/",
+        "webhook_test": "POST /test/scenarios/failed_build" if settings.environment == "development" else "disabled",
+        "documentation": "/docs" if settings.debug else "disabled"
     }
+})
+
+
+@app.get("/", response_model=None)
+async def root() -> Response:
+    """🏠 Root endpoint with service information."""
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -8,9 +8,13 @@ Classes:
     ProxyMailBox: Wrapper for IMAP connections through proxy
 """
 
+import email
 import imaplib
 import ssl
 import socket
+from datetime import datetime, timezone
+from email.header import decode_header
+from email.utils import parsedate_to_datetime
 from typing import Optional, Union
 from contextlib import contextmanager
 
@@ -180,11 +184,6 @@ class ProxyMailBox:
         Returns:
             List of email message objects
         """
-        import email
-        from email.header import decode_header
-        from datetime import datetime, timezone
-        from email.utils import parsedate_to_datetime
-        
         # Search for messages
         status, messages = self._imap.search(None, criteria)
         if status != 'OK':
@@ -221,7 +220,6 @@ class SimpleMessage:
         # Decode subject
         subject = raw_msg.get('Subject', '')
         if subject:
-            from email.header import decode_header
             decoded_subject = decode_header(subject)
             self.subject = ''.join([
                 part[0].decode(part[1] or 'utf-8') if isinstance(part[0], bytes) else part[0]
@@ -236,10 +234,8 @@ class SimpleMessage:
         # Get date
         date_str = raw_msg.get('Date', '')
         try:
-            from email.utils import parsedate_to_datetime
             self.date = parsedate_to_datetime(date_str)
         except:
-            from datetime import datetime, timezone
             self.date = datetime.now(timezone.utc)
         
         # Get headers
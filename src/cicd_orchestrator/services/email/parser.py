@@ -9,15 +9,22 @@ Classes:
     EmailValidator: Validate emails for processing
 """
 
+import re
 from datetime import datetime, timezone
 from typing import Optional, Dict, Tuple, Any
 
 import structlog
 
 from ...core.config import settings
+from ...models.gitlab import GitLabPipelineStatus
 
 logger = structlog.get_logger(__name__)
 
+# Header validation constants, built once instead of on every email
+_REQUIRED_HEADER_FIELDS = ("project_id", "pipeline_id")
+_VALID_PIPELINE_STATUSES = frozenset(s.value for s in GitLabPipelineStatus)
+_ANGLE_ADDRESS_RE = re.compile(r'<([^>]+)>')
+
 
 class GitLabEmailParser:
     """Parser for GitLab pipeline notification emails."""
@@ -116,13 +123,12 @@ class GitLabEmailParser:
     def _validate_gitlab_headers(headers: Dict[str, str]) -> Optional[str]:
         """Validate GitLab headers for required fields and data integrity."""
         # Check required fields
-        required_fields = ["project_id", "pipeline_id"]
-        missing_fields = [field for field in required_fields if not headers.get(field)]
+        missing_fields = [field for field in _REQUIRED_HEADER_FIELDS if not headers.get(field)]
         
         logger.debug(
             "Validating GitLab headers",
             headers=headers,
-            required_fields=required_fields,
+            required_fields=_REQUIRED_HEADER_FIELDS,
             missing_fields=missing_fields
         )
         
@@ -145,16 +151,12 @@ class GitLabEmailParser:
             return "Invalid project_id or pipeline_id format (must be numeric)"
 
         # Validate pipeline status
-        valid_statuses = [
-            "pending", "running", "success", "failed", "canceled", 
-            "skipped", "manual", "scheduled", "created"
-        ]
         pipeline_status = headers.get("pipeline_status", "").lower()
-        if pipeline_status and pipeline_status not in valid_statuses:
+        if pipeline_status and pipeline_status not in _VALID_PIPELINE_STATUSES:
             logger.warning(
                 "Unknown pipeline status",
                 status=pipeline_status,
-                valid_statuses=valid_statuses
+                valid_statuses=sorted(_VALID_PIPELINE_STATUSES)
             )
             # Don't fail validation for unknown status, just log warning
 
@@ -249,8 +251,7 @@ class EmailValidator:
                     return False, f"Email not from configured GitLab email (expected: {expected_gitlab_email}, got: {actual_email})"
 
             # Check if subject contains failure indicators
-            failure_keywords_str = settings.email_failure_keywords
-            failure_keywords = [kw.strip() for kw in failure_keywords_str.split(',') if kw.strip()]
+            failure_keywords = settings.email_failure_keywords
             subject_lower = msg.subject.lower()
             if not any(keyword in subject_lower for keyword in failure_keywords):
                 return False, "Email subject doesn't indicate failure"
@@ -271,12 +272,11 @@ class EmailValidator:
         Returns:
             The extracted email address, or original string if no extraction needed
         """
-        import re
         if not from_field:
             return ""
             
         # Check if format is "Display Name <email@domain.com>"
-        match = re.search(r'<([^>]+)>', from_field)
+        match = _ANGLE_ADDRESS_RE.search(from_field)
         if match:
             return match.group(1).strip()
         
@@ -65,7 +65,7 @@ class BaseClient:
                 "base_url": self.api_url,
                 "headers": headers,
                 "timeout": httpx.Timeout(30.0),  # Fixed 30 second timeout
-                "limits": httpx.Limits(max_keepalive_connections=10, max_connections=20),
+                "limits": httpx.Limits(max_keepalive_connections=20, max_connections=20),
                 "verify": False,  # Disable SSL verification for internal GitLab
             }
             
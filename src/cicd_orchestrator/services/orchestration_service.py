@@ -1,12 +1,16 @@
 """Orchestration service for managing CI/CD error analysis workflow."""
 
 import asyncio
+import heapq
 import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import structlog
+from sqlalchemy import delete
 from sqlalchemy.future import select
 from imap_tools import AND
 
@@ -31,9 +35,16 @@ from ..models.orchestrator import (
 )
 from .gitlab import GitLabClient
 from .ai_service import AIService
+from .email import EmailUtils
 
 logger = structlog.get_logger(__name__)
 
+# Sort key for newest-first analysis listings
+_created_at = attrgetter("created_at")
+
+# Upper bound on parallel GitLab job log downloads per analysis
+_MAX_CONCURRENT_LOG_FETCHES = 5
+
 
 class OrchestrationService:
     """Main orchestration service for CI/CD error analysis."""
@@ -45,6 +56,94 @@ class OrchestrationService:
         self._email_monitoring_task: Optional[asyncio.Task] = None
         self._email_monitoring_running = False
         self._last_email_check: Optional[datetime] = None
+        # GitLab client shared by all analyses, created on first use
+        self._gitlab_client: Optional[GitLabClient] = None
+        # Running analysis tasks; the event loop only keeps weak references to them
+        self._analysis_tasks: Set["asyncio.Task[OrchestrationResponse]"] = set()
+
+    def _get_gitlab_client(self) -> GitLabClient:
+        """Get the shared GitLab client.
+        
+        One client is reused across analyses so its HTTP connection pools
+        stay warm instead of being rebuilt (with TLS handshakes) per request.
+        
+        Returns:
+            Shared GitLab client
+        """
+        if self._gitlab_client is None:
+            self._gitlab_client = GitLabClient(
+                base_url=settings.gitlab_base_url,
+                api_token=settings.gitlab_api_token,
+                timeout=settings.gitlab_api_timeout,
+            )
+        return self._gitlab_client
+
+    def start_analysis(self, request: OrchestrationRequest, request_id: str) -> None:
+        """Start a webhook analysis as an independent task on the running loop.
+        
+        The task is tracked until it finishes so drain() can wait for it
+        on shutdown.
+        
+        Args:
+            request: Orchestration request to process
+            request_id: Request ID for the analysis
+        """
+        task = asyncio.create_task(
+            self.process_webhook(request, request_id),
+            name=f"analysis-{request_id}",
+        )
+        self._analysis_tasks.add(task)
+        task.add_done_callback(self._on_analysis_done)
+
+    def _on_analysis_done(self, task: "asyncio.Task[OrchestrationResponse]") -> None:
+        """Release a finished analysis task and log unexpected outcomes.
+        
+        process_webhook records its own result, so only cancellation and
+        errors escaping it are logged here.
+        
+        Args:
+            task: Finished analysis task
+        """
+        self._analysis_tasks.discard(task)
+        
+        if task.cancelled():
+            logger.warning("Background analysis cancelled", task=task.get_name())
+            return
+        
+        error = task.exception()
+        if error is not None:
+            logger.error("Background analysis failed", task=task.get_name(), error=str(error))
+
+    async def drain(self, timeout: float) -> None:
+        """Wait for in-flight analyses, then cancel any still running.
+        
+        Called on application shutdown before close(), so running analyses
+        can finish with the GitLab client still open.
+        
+        Args:
+            timeout: Seconds to wait before cancelling unfinished analyses
+        """
+        if not self._analysis_tasks:
+            return
+        
+        logger.info(
+            "Waiting for background analyses to finish",
+            count=len(self._analysis_tasks),
+            timeout=timeout,
+        )
+        _, pending = await asyncio.wait(set(self._analysis_tasks), timeout=timeout)
+        
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning("Cancelled unfinished background analyses", count=len(pending))
+
+    async def close(self) -> None:
+        """Close the shared GitLab client connections."""
+        if self._gitlab_client is not None:
+            await self._gitlab_client.close()
+            self._gitlab_client = None
 
     @staticmethod
     def _clean_error_message(message: str) -> str:
@@ -104,8 +203,6 @@ class OrchestrationService:
     async def _check_and_process_emails(self):
         """Check for new emails and process them through orchestration."""
         try:
-            from .email import EmailUtils
-            
             logger.debug("Orchestrator checking for new emails")
             
             # Calculate date range for fetching emails
@@ -180,8 +277,6 @@ class OrchestrationService:
 
     async def _process_email_message(self, msg):
         """Process individual email message through orchestration workflow."""
-        from .email import EmailUtils
-        
         try:
             # Check if we've already processed this message
             if await self._is_email_already_processed(msg):
@@ -193,18 +288,18 @@ class OrchestrationService:
 
             # Use database session for this operation
             async with get_database_session() as db:
-                # Create database record
+                # Create database record; it is inserted by the first commit
+                # below instead of paying a separate round trip up front
                 processed_email = EmailUtils.create_processed_email_record(msg)
                 db.add(processed_email)
-                await db.commit()
 
                 # Extract GitLab headers
                 gitlab_headers, error_msg = EmailUtils.extract_gitlab_headers(msg)
                 
                 if not gitlab_headers:
+                    # Committed when the session context exits
                     processed_email.status = "no_gitlab_headers"
                     processed_email.error_message = self._clean_error_message(error_msg)
-                    await db.commit()
                     
                     logger.warning(
                         "No GitLab headers found in email",
@@ -228,6 +323,8 @@ class OrchestrationService:
                 elif hasattr(msg, 'text') and msg.text:
                     processed_email.error_message = self._clean_error_message(msg.text)
                 
+                # Commit before the long-running orchestration so the record is
+                # visible to duplicate checks and no transaction spans AI calls
                 processed_email.status = "processing_pipeline"
                 await db.commit()
 
@@ -364,10 +461,13 @@ Processing Details:
                     message_id = message_id_raw
                     
                 if message_id:
+                    # Only id and status are needed; loading the full row would
+                    # also pull the email body and GitLab log LOB columns
                     result = await db.execute(
-                        select(ProcessedEmail).where(ProcessedEmail.message_id == message_id)
+                        select(ProcessedEmail.id, ProcessedEmail.status)
+                        .where(ProcessedEmail.message_id == message_id)
                     )
-                    email_record = result.scalar_one_or_none()
+                    email_record = result.one_or_none()
                     if email_record:
                         # Only skip if email was successfully completed
                         # Allow reprocessing for failed, error, or incomplete statuses
@@ -381,15 +481,18 @@ Processing Details:
                                 subject=msg.subject
                             )
                             # Delete the incomplete record to allow fresh processing
-                            await db.delete(email_record)
+                            await db.execute(
+                                delete(ProcessedEmail).where(ProcessedEmail.id == email_record.id)
+                            )
                             await db.commit()
                             return False
                 
                 # Fallback: check by UID
                 result = await db.execute(
-                    select(ProcessedEmail).where(ProcessedEmail.message_uid == msg.uid)
+                    select(ProcessedEmail.id, ProcessedEmail.status)
+                    .where(ProcessedEmail.message_uid == msg.uid)
                 )
-                email_record = result.scalar_one_or_none()
+                email_record = result.one_or_none()
                 if email_record:
                     # Only skip if email was successfully completed
                     if email_record.status == "completed":
@@ -402,7 +505,9 @@ Processing Details:
                             subject=msg.subject
                         )
                         # Delete the incomplete record to allow fresh processing
-                        await db.delete(email_record)
+                        await db.execute(
+                            delete(ProcessedEmail).where(ProcessedEmail.id == email_record.id)
+                        )
                         await db.commit()
                         return False
                 
@@ -643,52 +748,48 @@ Processing Details:
         
         response.processing_steps.append("Fetching GitLab data")
         
-        async with GitLabClient(
-            base_url=settings.gitlab_base_url,
-            api_token=settings.gitlab_api_token,
-            timeout=settings.gitlab_api_timeout,
-        ) as gitlab_client:
+        gitlab_client = self._get_gitlab_client()
+        
+        try:
+            # Fetch project information
+            project_info = await gitlab_client.get_project_info(
+                response.project_id,
+                include_pipeline=True,
+            )
+            response.project_info = project_info
+            response.processing_steps.append("Fetched project information")
             
-            try:
-                # Fetch project information
-                project_info = await gitlab_client.get_project_info(
-                    response.project_id,
-                    include_pipeline=True,
+            # Strategy 1: Use webhook data if available and complete
+            webhook_has_logs = self._webhook_has_sufficient_logs(request.webhook_data)
+            
+            if not webhook_has_logs and settings.gitlab_auto_fetch_logs:
+                logger.info(
+                    "Webhook lacks sufficient log data, fetching from GitLab API",
+                    request_id=response.request_id
                 )
-                response.project_info = project_info
-                response.processing_steps.append("Fetched project information")
-                
-                # Strategy 1: Use webhook data if available and complete
-                webhook_has_logs = self._webhook_has_sufficient_logs(request.webhook_data)
-                
-                if not webhook_has_logs and settings.gitlab_auto_fetch_logs:
-                    logger.info(
-                        "Webhook lacks sufficient log data, fetching from GitLab API",
-                        request_id=response.request_id
-                    )
-                    await self._fetch_logs_from_gitlab(gitlab_client, response)
-                elif webhook_has_logs:
-                    logger.info(
-                        "Using log data from webhook",
-                        request_id=response.request_id
-                    )
-                    self._extract_logs_from_webhook(request.webhook_data, response)
-                else:
-                    logger.warning(
-                        "No log fetching strategy available",
-                        request_id=response.request_id
-                    )
-                
-                # Fetch additional context if configured
-                await self._fetch_gitlab_context(gitlab_client, response, request)
-                
-            except GitLabAPIError as e:
-                logger.error(
-                    "GitLab API error during data fetch",
-                    request_id=response.request_id,
-                    error=str(e),
+                await self._fetch_logs_from_gitlab(gitlab_client, response)
+            elif webhook_has_logs:
+                logger.info(
+                    "Using log data from webhook",
+                    request_id=response.request_id
                 )
-                raise
+                self._extract_logs_from_webhook(request.webhook_data, response)
+            else:
+                logger.warning(
+                    "No log fetching strategy available",
+                    request_id=response.request_id
+                )
+            
+            # Fetch additional context if configured
+            await self._fetch_gitlab_context(gitlab_client, response, request)
+            
+        except GitLabAPIError as e:
+            logger.error(
+                "GitLab API error during data fetch",
+                request_id=response.request_id,
+                error=str(e),
+            )
+            raise
         
         logger.info(
             "GitLab data fetch completed",
@@ -715,152 +816,150 @@ Processing Details:
         
         response.processing_steps.append("Fetching detailed logs from GitLab")
         
-        async with GitLabClient(
-            base_url=settings.gitlab_base_url,
-            api_token=settings.gitlab_api_token,
-            timeout=settings.gitlab_api_timeout,
-        ) as gitlab_client:
+        gitlab_client = self._get_gitlab_client()
+        
+        try:
+            # Get fresh pipeline information from GitLab
+            pipeline = await gitlab_client.get_pipeline(
+                response.project_id, 
+                response.pipeline_id
+            )
             
-            try:
-                # Get fresh pipeline information from GitLab
-                pipeline = await gitlab_client.get_pipeline(
-                    response.project_id, 
-                    response.pipeline_id
-                )
-                
-                logger.info(
-                    "Pipeline info from GitLab",
-                    request_id=response.request_id,
-                    pipeline_status=pipeline.status,
-                    pipeline_ref=pipeline.ref,
-                )
-                
-                # Get only failed jobs - no need to fetch all jobs since we only analyze failures
-                failed_jobs = await gitlab_client.get_failed_jobs(
-                    response.project_id, 
-                    response.pipeline_id
-                )
-                
-                logger.info(
-                    "Failed job analysis from GitLab",
+            logger.info(
+                "Pipeline info from GitLab",
+                request_id=response.request_id,
+                pipeline_status=pipeline.status,
+                pipeline_ref=pipeline.ref,
+            )
+            
+            # Get only failed jobs - no need to fetch all jobs since we only analyze failures
+            failed_jobs = await gitlab_client.get_failed_jobs(
+                response.project_id, 
+                response.pipeline_id
+            )
+            
+            logger.info(
+                "Failed job analysis from GitLab",
+                request_id=response.request_id,
+                failed_jobs=len(failed_jobs),
+                failed_job_names=[job.name for job in failed_jobs] if failed_jobs else [],
+                pipeline_status=pipeline.status.value if hasattr(pipeline.status, 'value') else str(pipeline.status),
+            )
+            
+            # If no failed jobs found but email reported failure, 
+            # check for retried/historical failures in the pipeline
+            if len(failed_jobs) == 0 and pipeline.status.value == "success":
+                logger.warning(
+                    "Pipeline is now successful but email reported failure - checking for retried/historical failures",
                     request_id=response.request_id,
-                    failed_jobs=len(failed_jobs),
-                    failed_job_names=[job.name for job in failed_jobs] if failed_jobs else [],
-                    pipeline_status=pipeline.status.value if hasattr(pipeline.status, 'value') else str(pipeline.status),
+                    pipeline_status=pipeline.status.value,
                 )
                 
-                # If no failed jobs found but email reported failure, 
-                # check for retried/historical failures in the pipeline
-                if len(failed_jobs) == 0 and pipeline.status.value == "success":
-                    logger.warning(
-                        "Pipeline is now successful but email reported failure - checking for retried/historical failures",
+                # Get all jobs including retried ones to find original failures
+                try:
+                    all_jobs_with_retries = await gitlab_client.get_pipeline_jobs(
+                        response.project_id, 
+                        response.pipeline_id,
+                        include_retried=True  # Include retried jobs
+                    )
+                    
+                    # Look for jobs that failed before being retried
+                    historical_failed_jobs = [
+                        job for job in all_jobs_with_retries 
+                        if job.status in ["failed", "canceled"] or 
+                        (hasattr(job, 'failure_reason') and job.failure_reason)
+                    ]
+                    
+                    logger.info(
+                        "Found historical failed jobs from retries",
                         request_id=response.request_id,
-                        pipeline_status=pipeline.status.value,
+                        total_with_retries=len(all_jobs_with_retries),
+                        historical_failures=len(historical_failed_jobs),
                     )
                     
-                    # Get all jobs including retried ones to find original failures
-                    try:
-                        all_jobs_with_retries = await gitlab_client.get_pipeline_jobs(
-                            response.project_id, 
-                            response.pipeline_id,
-                            include_retried=True  # Include retried jobs
-                        )
+                    if historical_failed_jobs:
+                        failed_jobs = historical_failed_jobs[:3]  # Limit to first 3 failures
                         
-                        # Look for jobs that failed before being retried
-                        historical_failed_jobs = [
-                            job for job in all_jobs_with_retries 
-                            if job.status in ["failed", "canceled"] or 
-                            (hasattr(job, 'failure_reason') and job.failure_reason)
-                        ]
-                        
-                        logger.info(
-                            "Found historical failed jobs from retries",
-                            request_id=response.request_id,
-                            total_with_retries=len(all_jobs_with_retries),
-                            historical_failures=len(historical_failed_jobs),
-                        )
-                        
-                        if historical_failed_jobs:
-                            failed_jobs = historical_failed_jobs[:3]  # Limit to first 3 failures
-                            
-                    except Exception as retry_error:
-                        logger.warning(
-                            "Failed to fetch retried jobs",
-                            request_id=response.request_id,
-                            error=str(retry_error),
-                        )
-                
-                # Fetch detailed logs for failed jobs with enhanced context
-                enhanced_job_logs = []
-                
-                for job in failed_jobs:
-                    try:
-                        # Get comprehensive job log with context
-                        job_log = await gitlab_client.get_job_log(
-                            response.project_id,
-                            job.id,
-                            max_size_mb=10,  # Increase limit for detailed analysis
-                            context_lines=50  # More context around errors
-                        )
-                        enhanced_job_logs.append(job_log)
-                        
-                        logger.info(
-                            "Fetched detailed job log from GitLab",
-                            request_id=response.request_id,
-                            job_id=job.id,
-                            job_name=job.name,
-                            job_stage=job.stage,
-                            log_size=len(job_log.log_content) if job_log.log_content else 0,
-                        )
-                        
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to fetch job log from GitLab",
-                            request_id=response.request_id,
-                            job_id=job.id,
-                            error=str(e),
-                        )
-                
-                # Update response with enhanced logs from GitLab
-                if enhanced_job_logs:
-                    # Replace or merge with existing logs
-                    response.job_logs = enhanced_job_logs
-                    response.processing_steps.append(
-                        f"Fetched {len(enhanced_job_logs)} detailed job logs from GitLab"
+                except Exception as retry_error:
+                    logger.warning(
+                        "Failed to fetch retried jobs",
+                        request_id=response.request_id,
+                        error=str(retry_error),
+                    )
+            
+            # Fetch detailed logs for failed jobs with enhanced context
+            enhanced_job_logs = []
+            
+            # Get comprehensive job logs with context, fetched concurrently
+            results = await self._fetch_job_logs(
+                gitlab_client,
+                response.project_id,
+                [job.id for job in failed_jobs],
+                max_size_mb=10,  # Increase limit for detailed analysis
+                context_lines=50  # More context around errors
+            )
+            
+            for job, job_log in zip(failed_jobs, results):
+                if isinstance(job_log, Exception):
+                    logger.warning(
+                        "Failed to fetch job log from GitLab",
+                        request_id=response.request_id,
+                        job_id=job.id,
+                        error=str(job_log),
                     )
+                    continue
                 
-                # Fetch additional context from GitLab
-                await self._fetch_additional_context(gitlab_client, response)
+                enhanced_job_logs.append(job_log)
                 
-            except GitLabAPIError as e:
-                logger.error(
-                    "Failed to fetch data from GitLab",
+                logger.info(
+                    "Fetched detailed job log from GitLab",
                     request_id=response.request_id,
-                    error=str(e),
-                    status_code=getattr(e, 'status_code', None),
+                    job_id=job.id,
+                    job_name=job.name,
+                    job_stage=job.stage,
+                    log_size=len(job_log.log_content) if job_log.log_content else 0,
                 )
-                # Don't fail the entire process, continue with existing data
+            
+            # Update response with enhanced logs from GitLab
+            if enhanced_job_logs:
+                # Replace or merge with existing logs
+                response.job_logs = enhanced_job_logs
                 response.processing_steps.append(
-                    f"Warning: Failed to fetch from GitLab: {str(e)}"
+                    f"Fetched {len(enhanced_job_logs)} detailed job logs from GitLab"
                 )
-                
-            except Exception as e:
+            
+            # Fetch additional context from GitLab
+            await self._fetch_additional_context(gitlab_client, response)
+            
+        except GitLabAPIError as e:
+            logger.error(
+                "Failed to fetch data from GitLab",
+                request_id=response.request_id,
+                error=str(e),
+                status_code=getattr(e, 'status_code', None),
+            )
+            # Don't fail the entire process, continue with existing data
+            response.processing_steps.append(
+                f"Warning: Failed to fetch from GitLab: {str(e)}"
+            )
+            
+        except Exception as e:
+            logger.error(
+                "Unexpected error fetching from GitLab",
+                request_id=response.request_id,
+                error=str(e),
+            )
+            response.processing_steps.append(
+                f"Warning: Unexpected error with GitLab: {str(e)}"
+            )
+            # If this is a critical validation error, we should re-raise to fail the process
+            if "validation errors" in str(e).lower():
                 logger.error(
-                    "Unexpected error fetching from GitLab",
+                    "Critical validation error in GitLab response - failing process",
                     request_id=response.request_id,
-                    error=str(e),
+                    error=str(e)
                 )
-                response.processing_steps.append(
-                    f"Warning: Unexpected error with GitLab: {str(e)}"
-                )
-                # If this is a critical validation error, we should re-raise to fail the process
-                if "validation errors" in str(e).lower():
-                    logger.error(
-                        "Critical validation error in GitLab response - failing process",
-                        request_id=response.request_id,
-                        error=str(e)
-                    )
-                    raise
+                raise
         
         logger.info(
             "GitLab fetch completed",
@@ -1041,46 +1140,49 @@ Processing Details:
             
             response.processing_steps.append(f"Found {len(failed_jobs)} failed jobs: {', '.join([job.name for job in failed_jobs])}")
             
-            # Fetch logs for each failed job 
-            job_logs = []
+            # Fetch logs for all failed jobs concurrently
             for job in failed_jobs:
-                try:
-                    logger.info(
-                        "Fetching log for failed job",
-                        request_id=response.request_id,
-                        job_id=job.id,
-                        job_name=job.name,
-                        job_stage=job.stage,
-                        job_status=job.status.value if hasattr(job.status, 'value') else str(job.status),
-                        failure_reason=getattr(job, 'failure_reason', 'No failure reason provided'),
-                    )
-                    
-                    job_log = await gitlab_client.get_job_log(
-                        response.project_id,
-                        job.id,
-                        max_size_mb=5,  # Reasonable limit for logs
-                        context_lines=20  # Some context around errors
-                    )
-                    job_logs.append(job_log)
-                    
-                    logger.info(
-                        "Successfully fetched failed job log",
-                        request_id=response.request_id,
-                        job_id=job.id,
-                        job_name=job.name,
-                        job_stage=job.stage,
-                        log_size=len(job_log.log_content) if job_log.log_content else 0,
-                        has_failure_reason=bool(job_log.failure_reason),
-                    )
-                    
-                except Exception as e:
+                logger.info(
+                    "Fetching log for failed job",
+                    request_id=response.request_id,
+                    job_id=job.id,
+                    job_name=job.name,
+                    job_stage=job.stage,
+                    job_status=job.status.value if hasattr(job.status, 'value') else str(job.status),
+                    failure_reason=getattr(job, 'failure_reason', 'No failure reason provided'),
+                )
+            
+            results = await self._fetch_job_logs(
+                gitlab_client,
+                response.project_id,
+                [job.id for job in failed_jobs],
+                max_size_mb=5,  # Reasonable limit for logs
+                context_lines=20  # Some context around errors
+            )
+            
+            job_logs = []
+            for job, job_log in zip(failed_jobs, results):
+                if isinstance(job_log, Exception):
                     logger.warning(
                         "Failed to fetch log for specific failed job",
                         request_id=response.request_id,
                         job_id=job.id,
                         job_name=getattr(job, 'name', 'unknown'),
-                        error=str(e),
+                        error=str(job_log),
                     )
+                    continue
+                
+                job_logs.append(job_log)
+                
+                logger.info(
+                    "Successfully fetched failed job log",
+                    request_id=response.request_id,
+                    job_id=job.id,
+                    job_name=job.name,
+                    job_stage=job.stage,
+                    log_size=len(job_log.log_content) if job_log.log_content else 0,
+                    has_failure_reason=bool(job_log.failure_reason),
+                )
             
             response.job_logs = job_logs
             response.processing_steps.append(f"Successfully fetched logs for {len(job_logs)}/{len(failed_jobs)} failed jobs")
@@ -1095,6 +1197,57 @@ Processing Details:
             # Strategy 2: Fallback - get all jobs and filter failed ones manually
             await self._fetch_logs_fallback_method(gitlab_client, response)
 
+    async def _fetch_job_logs(
+        self,
+        gitlab_client: GitLabClient,
+        project_id: int,
+        job_ids: List[int],
+        max_size_mb: Optional[int] = None,
+        context_lines: Optional[int] = None,
+    ) -> List[Any]:
+        """Fetch several job logs concurrently.
+        
+        Concurrency is capped by _MAX_CONCURRENT_LOG_FETCHES so large
+        pipelines do not flood the GitLab API.
+        
+        Args:
+            gitlab_client: Open GitLab client
+            project_id: GitLab project ID
+            job_ids: Job IDs to fetch logs for
+            max_size_mb: Maximum log size in MB
+            context_lines: Number of context lines around errors
+            
+        Returns:
+            One entry per job ID, in order: the job log, or the exception
+            raised while fetching it
+            
+        Raises:
+            asyncio.CancelledError: When any fetch was cancelled
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_LOG_FETCHES)
+        
+        async def fetch(job_id: int) -> GitLabJobLog:
+            async with semaphore:
+                return await gitlab_client.get_job_log(
+                    project_id,
+                    job_id,
+                    max_size_mb=max_size_mb,
+                    context_lines=context_lines
+                )
+        
+        results = await asyncio.gather(
+            *(fetch(job_id) for job_id in job_ids),
+            return_exceptions=True,
+        )
+        
+        # Only ordinary errors are per-job results; cancellation and other
+        # BaseExceptions must propagate instead of being treated as a log
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        
+        return results
+
     async def _fetch_logs_fallback_method(
         self,
         gitlab_client: GitLabClient, 
@@ -1138,65 +1291,69 @@ Processing Details:
                     webhook_failed_job_ids=response.failed_job_ids,
                 )
                 
+                results = await self._fetch_job_logs(
+                    gitlab_client,
+                    response.project_id,
+                    response.failed_job_ids,
+                    max_size_mb=5,
+                    context_lines=20
+                )
+                
                 job_logs = []
-                for job_id in response.failed_job_ids:
-                    try:
-                        job_log = await gitlab_client.get_job_log(
-                            response.project_id,
-                            job_id,
-                            max_size_mb=5,
-                            context_lines=20
-                        )
-                        job_logs.append(job_log)
-                        
-                        logger.info(
-                            "Fetched log using webhook job ID",
-                            request_id=response.request_id,
-                            job_id=job_id,
-                            log_size=len(job_log.log_content) if job_log.log_content else 0,
-                        )
-                        
-                    except Exception as job_error:
+                for job_id, job_log in zip(response.failed_job_ids, results):
+                    if isinstance(job_log, Exception):
                         logger.warning(
                             "Failed to fetch job log by webhook ID",
                             request_id=response.request_id,
                             job_id=job_id,
-                            error=str(job_error),
+                            error=str(job_log),
                         )
+                        continue
+                    
+                    job_logs.append(job_log)
+                    
+                    logger.info(
+                        "Fetched log using webhook job ID",
+                        request_id=response.request_id,
+                        job_id=job_id,
+                        log_size=len(job_log.log_content) if job_log.log_content else 0,
+                    )
                 
                 response.job_logs = job_logs
                 response.processing_steps.append(f"Fetched {len(job_logs)} job logs using webhook job IDs")
                 
             else:
                 # Fetch logs for manually identified failed jobs
+                results = await self._fetch_job_logs(
+                    gitlab_client,
+                    response.project_id,
+                    [job.id for job in failed_jobs],
+                    max_size_mb=5,
+                    context_lines=20
+                )
+                
                 job_logs = []
-                for job in failed_jobs:
-                    try:
-                        job_log = await gitlab_client.get_job_log(
-                            response.project_id,
-                            job.id,
-                            max_size_mb=5,
-                            context_lines=20
-                        )
-                        job_logs.append(job_log)
-                        
-                        logger.info(
-                            "Fetched log for manually identified failed job",
-                            request_id=response.request_id,
-                            job_id=job.id,
-                            job_name=job.name,
-                            job_stage=job.stage,
-                            log_size=len(job_log.log_content) if job_log.log_content else 0,
-                        )
-                        
-                    except Exception as job_error:
+                for job, job_log in zip(failed_jobs, results):
+                    if isinstance(job_log, Exception):
                         logger.warning(
                             "Failed to fetch log for manually identified job",
                             request_id=response.request_id,
                             job_id=job.id,
                             job_name=getattr(job, 'name', 'unknown'),
-                            error=str(job_error),
+                            error=str(job_log),
                         )
+                        continue
+                    
+                    job_logs.append(job_log)
+                    
+                    logger.info(
+                        "Fetched log for manually identified failed job",
+                        request_id=response.request_id,
+                        job_id=job.id,
+                        job_name=job.name,
+                        job_stage=job.stage,
+                        log_size=len(job_log.log_content) if job_log.log_content else 0,
+                    )
                 
                 response.job_logs = job_logs
                 response.processing_steps.append(f"Fetched {len(job_logs)} job logs using fallback manual identification")
@@ -1494,13 +1651,104 @@ Processing Details:
         """
         return self._active_analyses.get(request_id)
 
-    async def list_active_analyses(self) -> List[OrchestrationResponse]:
-        """List all active analyses.
+    def _filter_analyses(
+        self,
+        status: Optional[str] = None,
+        project_id: Optional[int] = None,
+    ) -> List[OrchestrationResponse]:
+        """Select analyses matching the given filters.
+        
+        Args:
+            status: Only include analyses with this status
+            project_id: Only include analyses for this GitLab project
+            
+        Returns:
+            Matching orchestration responses in insertion order
+        """
+        analyses = self._active_analyses.values()
+        if status is None and project_id is None:
+            return list(analyses)
+        return [
+            analysis for analysis in analyses
+            if (status is None or analysis.status == status)
+            and (project_id is None or analysis.project_id == project_id)
+        ]
+
+    async def list_active_analyses(
+        self,
+        limit: Optional[int] = None,
+        status: Optional[str] = None,
+        project_id: Optional[int] = None,
+    ) -> List[OrchestrationResponse]:
+        """List active analyses, newest first.
         
+        Args:
+            limit: Maximum number of analyses to return, all when None
+            status: Only include analyses with this status
+            project_id: Only include analyses for this GitLab project
+            
         Returns:
             List of active orchestration responses
         """
-        return list(self._active_analyses.values())
+        matches = self._filter_analyses(status=status, project_id=project_id)
+        if limit is not None:
+            # Partial selection instead of sorting every match
+            return heapq.nlargest(limit, matches, key=_created_at)
+        matches.sort(key=_created_at, reverse=True)
+        return matches
+
+    async def count_active_analyses(self) -> int:
+        """Count active analyses without materializing them.
+        
+        Returns:
+            Number of active orchestration responses
+        """
+        return len(self._active_analyses)
+
+    async def list_analyses_projection(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        status: Optional[str] = None,
+        project_id: Optional[int] = None,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """List a filtered page of analyses as flat summary rows.
+        
+        Only the fields needed for a summary are projected, so callers
+        never touch the nested AI analysis models.
+        
+        Args:
+            limit: Maximum number of rows to return
+            offset: Number of matching rows to skip
+            status: Only include analyses with this status
+            project_id: Only include analyses for this GitLab project
+            
+        Returns:
+            Tuple of (total matching analyses, page of summary rows)
+        """
+        matches = self._filter_analyses(status=status, project_id=project_id)
+        matches.sort(key=_created_at, reverse=True)
+        
+        rows: List[Dict[str, Any]] = []
+        append = rows.append
+        for analysis in matches[offset:offset + limit]:
+            # Fields can be reassigned without validation, so enum values are
+            # read defensively instead of wrapping the row in try/except
+            ai_analysis = analysis.ai_analysis
+            provider = getattr(ai_analysis, "provider", None)
+            append({
+                "request_id": analysis.request_id,
+                "status": getattr(analysis.status, "value", analysis.status),
+                "project_id": analysis.project_id,
+                "pipeline_id": analysis.pipeline_id,
+                # Not tracked currently; kept for the published schema
+                "job_id": None,
+                "created_at": analysis.created_at.isoformat(),
+                "processing_time_ms": analysis.total_processing_time_ms,
+                "ai_provider": getattr(provider, "value", provider),
+                "error_message": analysis.error_message,
+            })
+        return len(matches), rows
 
     async def health_check(self) -> Dict[str, bool]:
         """Perform health check on orchestration service dependencies.
@@ -1518,15 +1766,27 @@ Processing Details:
             # Check AI service
             ai_health = await self.ai_service.health_check()
             health_status["ai_service"] = any(ai_health.values())
-            health_status.update({f"ai_{k}": v for k, v in ai_health.items()})
+            health_status.update({f"ai_{k.value}": v for k, v in ai_health.items()})
         except Exception as e:
             logger.warning("AI service health check failed", error=str(e))
         
         try:
             # Check GitLab client
-            async with GitLabClient() as gitlab_client:
-                health_status["gitlab_client"] = await gitlab_client.health_check()
+            health_status["gitlab_client"] = await self._get_gitlab_client().health_check()
         except Exception as e:
             logger.warning("GitLab client health check failed", error=str(e))
         
         return health_status
+
+
+@lru_cache(maxsize=1)
+def get_shared_orchestration_service() -> OrchestrationService:
+    """Get the process-wide orchestration service instance.
+    
+    The service owns the AI provider clients and the in-memory analysis
+    state, so the application lifespan and every router share one instance.
+    
+    Returns:
+        Shared orchestration service
+    """
+    return OrchestrationService()
@@ -1,7 +1,10 @@
 """Mock data loader utility."""
 
+import itertools
 import json
 import random
+import secrets
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -10,6 +13,11 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Sequence for generated pipeline/job IDs. IDs are unique within the process
+# only: the clock seed wraps every ~28 hours and keeps pipeline IDs near the
+# 600000-700000 range, so a restart may reissue IDs from an earlier run
+_id_counter = itertools.count(int(time.time()) % 100000)
+
 class MockDataLoader:
     """Utility class to load and manage mock data from JSON files."""
     
@@ -27,6 +35,7 @@ class MockDataLoader:
             
         self.data_dir = Path(data_dir)
         self._cache: Dict[str, Any] = {}
+        self._scenario_index: Optional[Dict[str, List[str]]] = None
         
         logger.debug("MockDataLoader initialized", data_dir=str(self.data_dir))
     
@@ -152,10 +161,11 @@ class MockDataLoader:
                 "default_branch": "main"
             }
         
-        # Generate random IDs
-        pipeline_id = random.randint(600000, 700000)
-        job_id = random.randint(6000000, 7000000)
-        commit_sha = ''.join(random.choices('0123456789abcdef', k=40))
+        # Generate unique IDs
+        seq = next(_id_counter)
+        pipeline_id = 600000 + seq
+        job_id = 6000000 + seq
+        commit_sha = secrets.token_hex(20)
         
         now = datetime.now(timezone.utc)
         
@@ -215,9 +225,14 @@ class MockDataLoader:
     def list_available_scenarios(self) -> Dict[str, List[str]]:
         """List all available scenarios.
         
+        The index is built once and reused until clear_cache() is called.
+        
         Returns:
             Dictionary mapping scenario types to scenario names
         """
+        if self._scenario_index is not None:
+            return self._scenario_index
+        
         scenarios = {}
         
         scenario_files = [
@@ -230,11 +245,13 @@ class MockDataLoader:
             data = self._load_json_file(filename)
             scenarios[scenario_type] = list(data.keys())
         
+        self._scenario_index = scenarios
         return scenarios
     
     def clear_cache(self) -> None:
         """Clear the internal cache."""
         self._cache.clear()
+        self._scenario_index = None
         logger.debug("Mock data cache cleared")
 
 